@@ -4,30 +4,318 @@ Multi-Vault Synchronization Script
 Synchronizes linting rules and configurations across multiple vaults
 """
 
+import asyncio
+import atexit
+import errno
+import functools
+import hashlib
 import json
 import os
+import re
 import shutil
+import stat
 import subprocess
 import sys
+import tarfile
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+VAULT_ROOT_PLACEHOLDER = b'vault_root = "/path/to/vault"'
+PROFILE_PLACEHOLDER = b'active = "default"'
+
+# Matches either placeholder so both are substituted in a single scan
+_TOML_PLACEHOLDERS = re.compile(b"|".join(map(re.escape, (VAULT_ROOT_PLACEHOLDER, PROFILE_PLACEHOLDER))))
+
+# A component is missing, is not a directory, or is a symlink loop
+_MISSING_PATH_ERRNOS = {errno.ENOENT, errno.ENOTDIR, errno.ELOOP}
+
+# copy_file_range errors that mean "not supported here" rather than a real failure
+_KERNEL_COPY_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+
+
+def _safe_stat(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat a path once, returning None if it does not exist"""
+    try:
+        return os.stat(path)
+    except OSError as e:
+        # Same cases Path.exists() treats as "does not exist"
+        if e.errno in _MISSING_PATH_ERRNOS:
+            return None
+        raise
+
+
+def _is_dir(st: Optional[os.stat_result]) -> bool:
+    """Check a _safe_stat result for an existing directory"""
+    return st is not None and stat.S_ISDIR(st.st_mode)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# fdatasync skips flushing metadata such as atime; not every platform has it
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _write_durable(path: Union[str, Path], data: bytes):
+    """Write data to path with a single write and sync it, and its directory entry, to disk"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        _datasync(fd)
+    finally:
+        os.close(fd)
+
+    # A newly created file only survives a crash once its directory entry
+    # does, so sync the parent directory too (not possible on Windows)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _from_dict(cls, data: Dict):
+    """Build a config dataclass from JSON data, ignoring unknown keys"""
+    known = {f.name for f in fields(cls)}
+    return cls(**{key: value for key, value in data.items() if key in known})
+
+
+@dataclass(frozen=True)
+class VaultConfig:
+    path: str
+    profile: str
+    sync_rules: bool = True
+    auto_fix: bool = False
+    backup: bool = False
+
+
+@dataclass(frozen=True)
+class SyncSettings:
+    sync_profiles: bool = True
+    sync_rules: bool = True
+    create_backups: bool = True
+    parallel_processing: bool = False
+
+
+@dataclass(frozen=True)
+class MultiVaultConfig:
+    vaults: Dict[str, VaultConfig]
+    master_config: str
+    sync_settings: SyncSettings
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MultiVaultConfig":
+        return cls(
+            vaults={name: _from_dict(VaultConfig, vault) for name, vault in data["vaults"].items()},
+            master_config=data["master_config"],
+            sync_settings=_from_dict(SyncSettings, data.get("sync_settings", {}))
+        )
+
+
+@dataclass(frozen=True)
+class VaultPaths:
+    """Filesystem locations of a vault, joined once as plain strings"""
+    root: str
+    config_dir: str
+    config_toml: str
+    sync_stamp: str
+
+    @classmethod
+    def from_root(cls, root: str) -> "VaultPaths":
+        # Normalised as Path() does, so "/x//Vault/" is shown and passed on as "/x/Vault"
+        root = str(Path(root))
+        config_dir = os.path.join(root, ".config/obsidian-lint")
+        return cls(
+            root=root,
+            config_dir=config_dir,
+            config_toml=os.path.join(config_dir, "obsidian-lint.toml"),
+            sync_stamp=os.path.join(config_dir, ".sync-stamp")
+        )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_json_config(path_str: str, mtime_ns: int) -> MultiVaultConfig:
+    """Parse a JSON config file, memoized on its path and mtime"""
+    with open(path_str, 'rb') as f:
+        return MultiVaultConfig.from_dict(_json_loads(f.read()))
+
+
+@functools.lru_cache(maxsize=16)
+def _read_master_toml(path_str: str, mtime_ns: int) -> bytes:
+    """Read the master TOML config, memoized on its path and mtime"""
+    with open(path_str, 'rb') as f:
+        return f.read()
+
+
+def _walk_fast(root: str, follow_symlinks: bool = False) -> Iterator[Tuple[os.DirEntry, os.stat_result]]:
+    """Yield (entry, stat) for every non-directory entry under root
+
+    os.scandir hands back entries whose type (and, once fetched, stat) is
+    cached, so nothing under root is stat()ed more than once. Without
+    follow_symlinks a link is reported as itself, with its own lstat. With
+    follow_symlinks, links are resolved as copytree(symlinks=False) does:
+    the stat describes the target, linked directories are walked like real
+    ones (except links back to a directory already being walked) and
+    dangling links are skipped.
+    """
+    ancestors = frozenset()
+    if follow_symlinks:
+        root_stat = os.stat(root)
+        ancestors = frozenset({(root_stat.st_dev, root_stat.st_ino)})
+
+    stack = [(root, ancestors)]
+    while stack:
+        directory, ancestors = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                    # Directories only need a stat to spot link loops
+                    st = entry.stat(follow_symlinks=follow_symlinks) if follow_symlinks or not is_dir else None
+                except OSError as e:
+                    # A dangling link, or an entry removed mid-walk
+                    if e.errno in _MISSING_PATH_ERRNOS:
+                        continue
+                    raise
+
+                if not is_dir:
+                    yield entry, st
+                elif not follow_symlinks:
+                    stack.append((entry.path, ancestors))
+                else:
+                    key = (st.st_dev, st.st_ino)
+                    # A link to an enclosing directory would recurse forever
+                    if key not in ancestors:
+                        stack.append((entry.path, ancestors | {key}))
+
+
+def _tree_fingerprint(files: Dict[str, Tuple[int, int]]) -> str:
+    """Hash a file listing such as _scan_tree's, so any added, removed or re-stamped file changes it
+
+    Every file's (size, mtime_ns) is included, not just the newest mtime,
+    so edits that carry an older mtime (cp -p, rsync -t, restores) count.
+    """
+    digest = hashlib.sha256()
+    for rel_path, (size, mtime_ns) in sorted(files.items()):
+        digest.update(f"{rel_path}\0{size}\0{mtime_ns}\0".encode())
+    return digest.hexdigest()
+
+
+def _scan_tree(root: str, follow_symlinks: bool = False) -> Dict[str, Tuple[int, int]]:
+    """Map each file under root to its (size, mtime_ns), keyed by relative path
+
+    With follow_symlinks, symlinks are resolved, so the listing describes
+    the contents a copy reads through them.
+    """
+    files = {}
+    if not os.path.isdir(root):
+        return files
+
+    prefix_len = len(os.path.join(root, ""))
+    for entry, st in _walk_fast(root, follow_symlinks):
+        files[entry.path[prefix_len:]] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """A file's (size, mtime_ns), as _scan_tree lists it, or None if it is missing"""
+    st = _safe_stat(path)
+    return None if st is None else (st.st_size, st.st_mtime_ns)
+
+
+def _kernel_copy(src: str, dst: str):
+    """Copy file contents without passing them through userspace"""
+    if not hasattr(os, "copy_file_range"):
+        shutil.copyfile(src, dst)
+        return
+
+    unsupported = False
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            size = remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    # Some filesystems report 0 instead of an error when they
+                    # cannot copy; stopping part-way means the file shrank
+                    if remaining == size:
+                        unsupported = True
+                        break
+                    raise OSError(errno.EIO, f"copy_file_range stopped early copying {src}")
+                remaining -= copied
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+            unsupported = True
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    if unsupported:
+        shutil.copyfile(src, dst)
 
 
 class VaultManager:
     def __init__(self, config_file: str):
         self.config_file = Path(config_file)
         self.config = self.load_config()
+        # Every operation needs the same per-vault paths, so join them once
+        self._vault_paths = {
+            name: VaultPaths.from_root(vault.path) for name, vault in self.config.vaults.items()
+        }
+        self._profile_rules: Dict[str, Dict[str, Tuple[int, int]]] = {}
         self.log_file = Path.home() / ".local/share/obsidian-lint/multi-vault.log"
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
-
-    def load_config(self) -> Dict:
-        """Load multi-vault configuration"""
-        if not self.config_file.exists():
+        self._log_lock = threading.Lock()
+        # Opened on the first log() call, so read-only commands such as
+        # status and config never touch the log file
+        self._log_fh = None
+        self._log_second = -1
+        self._log_timestamp = ""
+
+    def load_config(self) -> MultiVaultConfig:
+        """Load multi-vault configuration
+
+        The parsed config is shared between loads of an unchanged file.
+        """
+        config_stat = _safe_stat(self.config_file)
+        if config_stat is None:
             self.create_default_config()
+            config_stat = os.stat(self.config_file)
 
-        with open(self.config_file, 'r') as f:
-            return json.load(f)
+        return _load_json_config(str(self.config_file), config_stat.st_mtime_ns)
 
     def create_default_config(self):
         """Create default multi-vault configuration"""
@@ -58,146 +346,382 @@ class VaultManager:
         }
 
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, 'w') as f:
-            json.dump(default_config, f, indent=2)
+        with open(self.config_file, 'wb') as f:
+            f.write(_json_dumps(default_config))
 
         print(f"Created default configuration at: {self.config_file}")
 
     def log(self, message: str):
         """Log message with timestamp"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
-        print(log_entry)
+        now = int(time.time())
+
+        with self._log_lock:
+            # Timestamps have one-second resolution, so format once per second
+            if now != self._log_second:
+                self._log_second = now
+                self._log_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            log_entry = f"[{self._log_timestamp}] {message}"
+
+            print(log_entry)
+            if self._log_fh is None:
+                self._open_log()
+            self._log_fh.write(log_entry + "\n")
+
+    def _open_log(self):
+        """Open the log file with one buffered handle for the rest of the run
+
+        The handle is flushed at the end of each operation and closed at
+        interpreter exit. Callers must hold the log lock.
+        """
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self._log_fh = open(self.log_file, 'a', buffering=65536)
+        atexit.register(self._log_fh.close)
 
-        with open(self.log_file, 'a') as f:
-            f.write(log_entry + "\n")
+    def flush_log(self):
+        """Flush buffered log entries and sync them to disk"""
+        with self._log_lock:
+            if self._log_fh is not None:
+                self._log_fh.flush()
+                _datasync(self._log_fh.fileno())
 
     def sync_configurations(self):
         """Sync configurations across all vaults"""
         self.log("Starting configuration synchronization...")
+        # Rule listings are shared by vaults using the same profile, but
+        # must be re-read on every sync in case the master rules changed
+        self._profile_rules.clear()
 
-        master_config = Path(self.config["master_config"])
-        if not master_config.exists():
+        master_config = self.config.master_config
+        if not _is_dir(_safe_stat(master_config)):
             self.log(f"ERROR: Master configuration not found: {master_config}")
+            self.flush_log()
             return False
 
-        for vault_name, vault_config in self.config["vaults"].items():
-            vault_path = Path(vault_config["path"])
-            if not vault_path.exists():
-                self.log(f"WARNING: Vault not found: {vault_path}")
-                continue
-
-            self.log(f"Syncing configuration for vault: {vault_name}")
-
-            # Create vault config directory
-            vault_config_dir = vault_path / ".config/obsidian-lint"
-            vault_config_dir.mkdir(parents=True, exist_ok=True)
-
-            # Sync main configuration
-            if self.config["sync_settings"]["sync_profiles"]:
-                self.sync_main_config(master_config, vault_config_dir, vault_config)
-
-            # Sync rules
-            if self.config["sync_settings"]["sync_rules"] and vault_config.get("sync_rules", True):
-                self.sync_rules(master_config, vault_config_dir, vault_config["profile"])
+        vaults = self.config.vaults
+        if self.config.sync_settings.parallel_processing and len(vaults) > 1:
+            # Per-vault syncs are independent mkdir/copy work, so overlap them
+            with ThreadPoolExecutor(max_workers=min(len(vaults), 8)) as executor:
+                list(executor.map(
+                    lambda item: self._sync_one_vault(*item, master_config),
+                    vaults.items()
+                ))
+        else:
+            for vault_name, vault_config in vaults.items():
+                self._sync_one_vault(vault_name, vault_config, master_config)
 
         self.log("Configuration synchronization completed")
+        self.flush_log()
         return True
 
-    def sync_main_config(self, master_config: Path, vault_config_dir: Path, vault_config: Dict):
+    def _sync_one_vault(self, vault_name: str, vault_config: VaultConfig, master_config: str):
+        """Sync configuration and rules into a single vault"""
+        paths = self._vault_paths[vault_name]
+        if not _is_dir(_safe_stat(paths.root)):
+            self.log(f"WARNING: Vault not found: {paths.root}")
+            return
+
+        # Skip the vault when neither the master files it consumes, the
+        # settings that shape its copy, nor the synced files in the vault
+        # have changed since the last successful sync
+        stamp = self._sync_stamp(vault_config, paths, master_config)
+        try:
+            with open(paths.sync_stamp, 'r') as f:
+                stamp_matches = f.read() == stamp
+        except FileNotFoundError:
+            stamp_matches = False
+        if stamp_matches:
+            self.log(f"Vault {vault_name}: configuration up to date, skipping")
+            return
+
+        self.log(f"Syncing configuration for vault: {vault_name}")
+
+        # Create vault config directory
+        os.makedirs(paths.config_dir, exist_ok=True)
+
+        # Sync main configuration
+        if self.config.sync_settings.sync_profiles:
+            self.sync_main_config(master_config, paths.config_dir, vault_config)
+
+        # Sync rules
+        if self.config.sync_settings.sync_rules and vault_config.sync_rules:
+            self.sync_rules(master_config, paths.config_dir, vault_config.profile)
+
+        # The sync changed the vault's files, so stamp their new state
+        with open(paths.sync_stamp, 'w') as f:
+            f.write(self._sync_stamp(vault_config, paths, master_config))
+
+    def _sync_stamp(self, vault_config: VaultConfig, paths: VaultPaths, master_config: str) -> str:
+        """Fingerprint of everything a vault's synced configuration depends on
+
+        Only the master files the vault consumes are listed, obsidian-lint.toml
+        and the rules of its profile, so other profiles and files in the master
+        directory neither invalidate the stamp nor get stat()ed for it. Their
+        synced copies in the vault are listed too, so a sync still repairs a
+        vault whose files were edited or removed.
+        """
+        settings = self.config.sync_settings
+        files = {}
+        if settings.sync_profiles:
+            tomls = (("master", os.path.join(master_config, "obsidian-lint.toml")), ("vault", paths.config_toml))
+            for side, toml_path in tomls:
+                signature = _file_signature(toml_path)
+                if signature is not None:
+                    files[f"{side}/obsidian-lint.toml"] = signature
+        if settings.sync_rules and vault_config.sync_rules:
+            rules_dir = os.path.join("rules", vault_config.profile)
+            listings = (
+                ("master", self._list_profile_rules(os.path.join(master_config, rules_dir))),
+                ("vault", _scan_tree(os.path.join(paths.config_dir, rules_dir)))
+            )
+            for side, rule_files in listings:
+                for rel_path, signature in rule_files.items():
+                    files[f"{side}/rules/{rel_path}"] = signature
+
+        inputs = (
+            self.config.master_config, vault_config.path, vault_config.profile,
+            vault_config.sync_rules, settings.sync_profiles, settings.sync_rules
+        )
+        checksum = hashlib.sha256(repr(inputs).encode()).hexdigest()
+        return f"{_tree_fingerprint(files)} {checksum}\n"
+
+    def sync_main_config(self, master_config: str, vault_config_dir: str, vault_config: VaultConfig):
         """Sync main configuration file"""
-        master_toml = master_config / "obsidian-lint.toml"
-        vault_toml = vault_config_dir / "obsidian-lint.toml"
+        master_toml = os.path.join(master_config, "obsidian-lint.toml")
+        vault_toml = os.path.join(vault_config_dir, "obsidian-lint.toml")
 
-        if master_toml.exists():
+        master_stat = _safe_stat(master_toml)
+        if master_stat is not None:
             # Read master config and customize for vault
-            with open(master_toml, 'r') as f:
-                config_content = f.read()
-
-            # Replace vault-specific settings
-            config_content = config_content.replace(
-                'vault_root = "/path/to/vault"',
-                f'vault_root = "{vault_config["path"]}"'
-            )
-            config_content = config_content.replace(
-                'active = "default"',
-                f'active = "{vault_config["profile"]}"'
-            )
+            config_content = _read_master_toml(master_toml, master_stat.st_mtime_ns)
+
+            # Replace vault-specific settings; with no placeholders the cached
+            # bytes are written out unchanged
+            if _TOML_PLACEHOLDERS.search(config_content) is not None:
+                replacements = {
+                    VAULT_ROOT_PLACEHOLDER: f'vault_root = "{vault_config.path}"'.encode(),
+                    PROFILE_PLACEHOLDER: f'active = "{vault_config.profile}"'.encode(),
+                }
+                config_content = _TOML_PLACEHOLDERS.sub(lambda m: replacements[m.group()], config_content)
 
-            with open(vault_toml, 'w') as f:
+            with open(vault_toml, 'wb') as f:
                 f.write(config_content)
 
-    def sync_rules(self, master_config: Path, vault_config_dir: Path, profile: str):
+    def sync_rules(self, master_config: str, vault_config_dir: str, profile: str):
         """Sync rules for specific profile"""
-        master_rules = master_config / "rules" / profile
-        vault_rules = vault_config_dir / "rules" / profile
-
-        if master_rules.exists():
-            if vault_rules.exists():
-                shutil.rmtree(vault_rules)
-            shutil.copytree(master_rules, vault_rules)
+        master_rules = os.path.join(master_config, "rules", profile)
+        vault_rules = os.path.join(vault_config_dir, "rules", profile)
+
+        if _is_dir(_safe_stat(master_rules)):
+            self._sync_tree_incremental(master_rules, vault_rules)
+
+    def _sync_tree_incremental(self, src: str, dst: str):
+        """Copy new or changed files from src to dst and remove files missing from src"""
+        pending = dict(self._list_profile_rules(src))
+        os.makedirs(dst, exist_ok=True)
+
+        # A single walk of dst sorts its files into stale and orphaned ones.
+        # Copied files keep the source mtime, so an unchanged file matches on
+        # (size, mtime_ns) next time. Changes are applied after the walk so it
+        # never sees the files it creates.
+        stale, orphans = [], []
+        prefix_len = len(os.path.join(dst, ""))
+        for entry, st in _walk_fast(dst):
+            rel_path = entry.path[prefix_len:]
+            signature = pending.pop(rel_path, None)
+            if signature is None:
+                orphans.append(entry.path)
+                continue
+            if (st.st_size, st.st_mtime_ns) != signature:
+                stale.append(rel_path)
+
+        for path in orphans:
+            os.unlink(path)
+            self._prune_empty_dirs(os.path.dirname(path), dst)
+
+        for rel_path in stale:
+            self._copy_rule_file(os.path.join(src, rel_path), os.path.join(dst, rel_path))
+
+        # Whatever was not seen in dst is new
+        for rel_path in pending:
+            target = os.path.join(dst, rel_path)
+            # A directory where the master now has a file of the same name
+            if _is_dir(_safe_stat(target)) and not os.path.islink(target):
+                shutil.rmtree(target)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            self._copy_rule_file(os.path.join(src, rel_path), target)
+
+    def _prune_empty_dirs(self, directory: str, root: str):
+        """Remove directory and its parents up to root while they are empty"""
+        while directory != root and directory.startswith(root):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                return
+            directory = os.path.dirname(directory)
+
+    def _copy_rule_file(self, source: str, target: str):
+        """Copy a rule file's contents and metadata, then swap it into place
+
+        Renaming a temporary file over the target works even when the
+        existing copy is read-only.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=".sync-")
+        os.close(fd)
+        try:
+            _kernel_copy(source, tmp_path)
+            shutil.copystat(source, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _list_profile_rules(self, master_rules: str) -> Dict[str, Tuple[int, int]]:
+        """Scan the rule files of a profile, once per sync"""
+        rule_files = self._profile_rules.get(master_rules)
+        if rule_files is None:
+            rule_files = _scan_tree(master_rules, follow_symlinks=True)
+            self._profile_rules[master_rules] = rule_files
+        return rule_files
 
     def run_linting(self, vault_names: Optional[List[str]] = None):
         """Run linting on specified vaults or all vaults"""
         if vault_names is None:
-            vault_names = list(self.config["vaults"].keys())
+            vault_names = list(self.config.vaults.keys())
 
         results = {}
 
-        for vault_name in vault_names:
-            if vault_name not in self.config["vaults"]:
+        # A vault named twice must not be linted (and backed up) twice at once
+        known_vaults = []
+        for vault_name in dict.fromkeys(vault_names):
+            if vault_name not in self.config.vaults:
                 self.log(f"WARNING: Unknown vault: {vault_name}")
                 continue
+            known_vaults.append(vault_name)
 
-            vault_config = self.config["vaults"][vault_name]
-            vault_path = Path(vault_config["path"])
-
-            if not vault_path.exists():
-                self.log(f"WARNING: Vault not found: {vault_path}")
-                continue
-
-            self.log(f"Running linting for vault: {vault_name}")
-
-            # Create backup if enabled
-            if vault_config.get("backup", False) and self.config["sync_settings"]["create_backups"]:
-                self.create_backup(vault_path, vault_name)
-
-            # Run linting
-            config_file = vault_path / ".config/obsidian-lint/obsidian-lint.toml"
-            cmd = [
-                "obsidian-lint",
-                "lint" if not vault_config.get("auto_fix", False) else "fix",
-                "--config", str(config_file),
-                "--json",
-                str(vault_path)
-            ]
+        if known_vaults:
+            results = asyncio.run(self._run_linting_async(known_vaults))
 
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                lint_result = json.loads(result.stdout)
-                results[vault_name] = lint_result
+        self.flush_log()
+        return results
 
-                issue_count = len(lint_result.get("issuesFound", []))
-                fix_count = len(lint_result.get("fixesApplied", []))
+    async def _run_linting_async(self, vault_names: List[str]) -> Dict:
+        """Lint vaults from a single event loop, concurrently when enabled"""
+        if self.config.sync_settings.parallel_processing:
+            # Vaults are independent, so overlap their subprocess and disk
+            # waits, with at most one obsidian-lint process per CPU
+            limit = asyncio.Semaphore(os.cpu_count() or 1)
 
-                self.log(f"Vault {vault_name}: {issue_count} issues, {fix_count} fixes")
+            async def lint_bounded(vault_name: str) -> Optional[Dict]:
+                async with limit:
+                    return await self._lint_one(vault_name)
 
-            except subprocess.CalledProcessError as e:
-                self.log(f"ERROR: Linting failed for vault {vault_name}: {e}")
-                results[vault_name] = {"error": str(e)}
+            outcomes = await asyncio.gather(
+                *(lint_bounded(name) for name in vault_names),
+                return_exceptions=True
+            )
+        else:
+            outcomes = []
+            for vault_name in vault_names:
+                try:
+                    outcomes.append(await self._lint_one(vault_name))
+                except Exception as e:
+                    outcomes.append(e)
 
+        results = {}
+        for vault_name, outcome in zip(vault_names, outcomes):
+            if isinstance(outcome, BaseException):
+                self.log(f"ERROR: Linting failed for vault {vault_name}: {outcome}")
+                results[vault_name] = {"error": str(outcome)}
+            elif outcome is not None:
+                results[vault_name] = outcome
         return results
 
-    def create_backup(self, vault_path: Path, vault_name: str):
-        """Create backup of vault before processing"""
+    async def _lint_one(self, vault_name: str) -> Optional[Dict]:
+        """Run linting on a single vault, returning None if it was skipped"""
+        vault_config = self.config.vaults[vault_name]
+        paths = self._vault_paths[vault_name]
+
+        if not _is_dir(_safe_stat(paths.root)):
+            self.log(f"WARNING: Vault not found: {paths.root}")
+            return None
+
+        self.log(f"Running linting for vault: {vault_name}")
+
+        # Create backup if enabled. Archiving is blocking work, so keep it
+        # off the event loop.
+        if vault_config.backup and self.config.sync_settings.create_backups:
+            await asyncio.to_thread(self.create_backup, paths.root, vault_name)
+
+        # Run linting. obsidian-lint takes a single vault path and a single
+        # --config per invocation, so vaults cannot be batched into one call;
+        # run_linting overlaps the per-vault processes instead.
+        cmd = [
+            "obsidian-lint",
+            "lint" if not vault_config.auto_fix else "fix",
+            "--config", paths.config_toml,
+            "--json",
+            paths.root
+        ]
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await proc.communicate()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+        lint_result = _json_loads(stdout)
+
+        issue_count = len(lint_result.get("issuesFound", []))
+        fix_count = len(lint_result.get("fixesApplied", []))
+
+        self.log(f"Vault {vault_name}: {issue_count} issues, {fix_count} fixes")
+        return lint_result
+
+    def create_backup(self, vault_path: str, vault_name: str) -> Path:
+        """Create backup of vault before processing
+
+        The vault is streamed into a single compressed tarball: .tar.zst when
+        the zstandard package is installed, .tar.gz otherwise. Restore with
+        tarfile, reading .tar.zst through a zstandard stream_reader.
+        """
         backup_dir = Path.home() / ".local/share/obsidian-lint/backups"
         backup_dir.mkdir(parents=True, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        backup_path = backup_dir / f"{vault_name}-{timestamp}"
-
-        self.log(f"Creating backup: {backup_path}")
-        shutil.copytree(vault_path, backup_path)
+        suffix = ".tar.zst" if zstandard is not None else ".tar.gz"
+
+        # Create the archive exclusively so a second backup within the same
+        # second gets its own name instead of overwriting the first
+        attempt = 0
+        while True:
+            unique = f"-{attempt}" if attempt else ""
+            backup_file = backup_dir / f"{vault_name}-{timestamp}{unique}{suffix}"
+            try:
+                raw = open(backup_file, 'xb')
+                break
+            except FileExistsError:
+                attempt += 1
+
+        self.log(f"Creating backup: {backup_file}")
+        try:
+            with raw:
+                if zstandard is not None:
+                    with zstandard.ZstdCompressor(level=3).stream_writer(raw) as compressed, \
+                            tarfile.open(fileobj=compressed, mode='w|') as tar:
+                        tar.add(vault_path, arcname=vault_name)
+                else:
+                    with tarfile.open(fileobj=raw, mode='w|gz') as tar:
+                        tar.add(vault_path, arcname=vault_name)
+        except BaseException:
+            # Never leave a truncated archive that looks like a usable backup
+            backup_file.unlink(missing_ok=True)
+            raise
+
+        return backup_file
 
     def generate_report(self, results: Dict):
         """Generate comprehensive report"""
@@ -207,20 +731,29 @@ class VaultManager:
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         report_file = report_dir / f"multi-vault-report-{timestamp}.json"
 
+        # Tally everything in a single pass over the results
+        successful = failed = total_issues = total_fixes = 0
+        for r in results.values():
+            if "error" in r:
+                failed += 1
+                continue
+            successful += 1
+            total_issues += len(r.get("issuesFound", ()))
+            total_fixes += len(r.get("fixesApplied", ()))
+
         report = {
             "timestamp": datetime.now().isoformat(),
             "vaults": results,
             "summary": {
                 "total_vaults": len(results),
-                "successful": len([r for r in results.values() if "error" not in r]),
-                "failed": len([r for r in results.values() if "error" in r]),
-                "total_issues": sum(len(r.get("issuesFound", [])) for r in results.values() if "error" not in r),
-                "total_fixes": sum(len(r.get("fixesApplied", [])) for r in results.values() if "error" not in r)
+                "successful": successful,
+                "failed": failed,
+                "total_issues": total_issues,
+                "total_fixes": total_fixes
             }
         }
 
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        _write_durable(report_file, _json_dumps(report))
 
         self.log(f"Report generated: {report_file}")
         return report_file
@@ -230,18 +763,21 @@ class VaultManager:
         print("\nMulti-Vault Status:")
         print("=" * 50)
 
-        for vault_name, vault_config in self.config["vaults"].items():
-            vault_path = Path(vault_config["path"])
-            config_path = vault_path / ".config/obsidian-lint/obsidian-lint.toml"
+        for vault_name, vault_config in self.config.vaults.items():
+            paths = self._vault_paths[vault_name]
+
+            # A missing vault cannot contain a config, so skip the second stat
+            vault_exists = _is_dir(_safe_stat(paths.root))
+            config_exists = vault_exists and _safe_stat(paths.config_toml) is not None
 
-            status = "✓" if vault_path.exists() else "✗"
-            config_status = "✓" if config_path.exists() else "✗"
+            status = "✓" if vault_exists else "✗"
+            config_status = "✓" if config_exists else "✗"
 
             print(f"Vault: {vault_name}")
-            print(f"  Path: {vault_path} {status}")
-            print(f"  Config: {config_path} {config_status}")
-            print(f"  Profile: {vault_config['profile']}")
-            print(f"  Auto-fix: {vault_config.get('auto_fix', False)}")
+            print(f"  Path: {paths.root} {status}")
+            print(f"  Config: {paths.config_toml} {config_status}")
+            print(f"  Profile: {vault_config.profile}")
+            print(f"  Auto-fix: {vault_config.auto_fix}")
             print()
 
 